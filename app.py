@@ -1,14 +1,28 @@
+import bisect
+import io
 import os
 import json
 import time
 import re
-from datetime import datetime, timezone, timedelta
-from typing import Any, Dict, List, Optional
-
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime, time as dtime, timezone, timedelta
+from functools import lru_cache
+from typing import Any, Dict, Iterator, List, NamedTuple, Optional, Tuple, Union
+
+import ijson
+import lxml.etree
+import lxml.html
+import msgpack
+import orjson
 import requests
-from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from bs4 import BeautifulSoup, Tag
 from dateutil import parser as dtparser
-from flask import Flask, request, jsonify, render_template_string
+from flask import Flask, Response, request, jsonify, render_template_string
+from flask.json.provider import JSONProvider
+from flask_compress import Compress
 from flask_cors import CORS
 import xml.etree.ElementTree as ET
 import os
@@ -17,6 +31,7 @@ DATABASE_URL = os.environ.get("DATABASE_URL")
 EVENTS_FILE = "events.json"
 
 CONVERSATION_HISTORY = []
+CONVERSATION_LOCK = threading.Lock()
 CURRENT_EVENT = None
 CURRENT_EVENTS = []
 
@@ -633,10 +648,22 @@ def load_events_from_file(filename: str) -> List[Dict[str, Any]]:
 PENDING_EVENTS_FILE = "pending_events.json"
 APPROVED_EVENTS_FILE = "approved_events.json"
 
+# Requests run on several threads, so every PENDING_EVENTS/APPROVED_EVENTS
+# mutation and the file write that follows it happen under this lock.
+EVENTS_LOCK = threading.RLock()
+
+def atomic_write(path: str, data: bytes) -> None:
+    # Write-then-rename so a crash or a concurrent reader never sees a
+    # truncated file.
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(data)
+    os.replace(tmp_path, path)
+
 def save_events_to_file(filename: str, events: List[Dict[str, Any]]) -> None:
     try:
-        with open(filename, "w", encoding="utf-8") as f:
-            json.dump(events, f, indent=2)
+        with EVENTS_LOCK:
+            atomic_write(filename, json.dumps(events, indent=2).encode("utf-8"))
     except Exception as e:
         print(f"Failed saving {filename}: {e}")
 def load_persistent_events() -> None:
@@ -644,14 +671,54 @@ def load_persistent_events() -> None:
     PENDING_EVENTS = load_events_from_file(PENDING_EVENTS_FILE)
     APPROVED_EVENTS = load_events_from_file(APPROVED_EVENTS_FILE)
 
+class ORJSONProvider(JSONProvider):
+    def dumps(self, obj: Any, **kwargs: Any) -> str:
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS).decode()
+
+    def loads(self, s: Union[str, bytes], **kwargs: Any) -> Any:
+        return orjson.loads(s)
+
+
 app = Flask(__name__)
+app.json = ORJSONProvider(app)
+app.config["COMPRESS_ALGORITHM"] = ["br", "gzip"]
+app.config["COMPRESS_MIN_SIZE"] = 512
 CORS(app)
+Compress(app)
 load_persistent_events()
 
 EL_NAME = "El"
 CACHE_TTL_SECONDS = 6 * 60 * 60
+CACHE_PATH = "/tmp/el_cache.msgpack"
 USER_AGENT = "SpliceEventBot/1.0 (+https://splice.social)"
 
+HEADERS = {
+    "User-Agent": (
+        "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) "
+        "AppleWebKit/537.36 (KHTML, like Gecko) Chrome/146.0.0.0 Safari/537.36"
+    ),
+    "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,image/apng,*/*;q=0.8",
+    "Accept-Language": "en-US,en;q=0.9",
+    "Cache-Control": "no-cache",
+    "Pragma": "no-cache",
+    "Referer": "https://www.google.com/",
+}
+
+# Scraping is I/O-bound, so source and detail-page fetches share one pool.
+EXECUTOR = ThreadPoolExecutor(max_workers=8)
+
+# One pooled session so repeat fetches to the same host reuse keep-alive
+# connections instead of paying a fresh TCP + TLS handshake each time.
+SESSION = requests.Session()
+_adapter = HTTPAdapter(
+    pool_connections=16,
+    pool_maxsize=16,
+    max_retries=Retry(total=3, backoff_factor=0.3),
+)
+SESSION.mount("http://", _adapter)
+SESSION.mount("https://", _adapter)
+SESSION.headers.update({"User-Agent": USER_AGENT})
+
 SOURCES = [
     {"name": "Greater Parkersburg", "url": "https://www.greaterparkersburg.com/events/"},
     {"name": "Parkersburg Art Center", "url": "https://www.parkersburgartcenter.org/upcomingcurrent-events"},
@@ -671,22 +738,34 @@ MANUAL_EVENTS = [
 PENDING_EVENTS: List[Dict[str, Any]] = []
 APPROVED_EVENTS: List[Dict[str, Any]] = []
 
-_cache: Dict[str, Any] = {
-    "ts": 0,
-    "events": [],
-}
+class Snapshot(NamedTuple):
+    ts: float
+    events: List[Dict[str, Any]]
+
+
+# The cache is an immutable snapshot that is only ever replaced whole, so
+# readers grab CURRENT once and never see a half-written refresh. Writers
+# still serialize on _cache_lock.
+CURRENT = Snapshot(ts=0, events=[])
+_cache_lock = threading.RLock()
+_refresh_requested = threading.Event()
+
+
+def invalidate_cache() -> None:
+    global CURRENT
+
+    with _cache_lock:
+        CURRENT = CURRENT._replace(ts=0)
+    _refresh_requested.set()
 
 def filter_future_events(events):
     today = datetime.now().date()
     filtered = []
 
     for e in events:
-        try:
-            start = dtparser.isoparse(e.get("start_dt", "")).date()
-            if start >= today:
-                filtered.append(e)
-        except Exception:
-            continue
+        start = parse_iso_utc(e.get("start_dt") or "")
+        if start and start.date() >= today:
+            filtered.append(e)
 
     return filtered
 
@@ -700,10 +779,9 @@ def test_add_event():
         "url": ""
     }
 
-    PENDING_EVENTS.append(event)
-    save_events_to_file(PENDING_EVENTS_FILE, PENDING_EVENTS)
-    _cache["ts"] = 0
-    
+    with EVENTS_LOCK:
+        PENDING_EVENTS.append(event)
+        save_events_to_file(PENDING_EVENTS_FILE, PENDING_EVENTS)
 
 
     return {"ok": True, "message": "Test event added"}
@@ -713,27 +791,50 @@ def now_utc() -> datetime:
     return datetime.now(timezone.utc)
 
 
-def fetch_html(url: str) -> str:
-    headers = {
-        "User-Agent": (
-            "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) "
-            "AppleWebKit/537.36 (KHTML, like Gecko) Chrome/146.0.0.0 Safari/537.36"
-        ),
-        "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,image/apng,*/*;q=0.8",
-        "Accept-Language": "en-US,en;q=0.9",
-        "Cache-Control": "no-cache",
-        "Pragma": "no-cache",
-        "Referer": "https://www.google.com/",
+# Validators from the last 200 per URL, and what we extracted from that
+# body, so an unchanged page costs a 304 and no parsing.
+HTTP_META: Dict[str, Dict[str, str]] = {}
+PARSED_BY_URL: Dict[str, Any] = {}
+
+
+def fetch_html(url: str, conditional: bool = False) -> Tuple[Optional[str], Dict[str, str]]:
+    # Returns the body and its validators. With conditional=True the body is
+    # None when the origin answers 304 and the caller should reuse
+    # PARSED_BY_URL[url]. The validators are only stored, via remember_parsed,
+    # once that body has parsed; otherwise a later 304 would pin the previous
+    # page's events.
+    headers = HEADERS
+    meta = HTTP_META.get(url) if conditional else None
+    if meta:
+        headers = dict(HEADERS)
+        if meta.get("etag"):
+            headers["If-None-Match"] = meta["etag"]
+        if meta.get("last_modified"):
+            headers["If-Modified-Since"] = meta["last_modified"]
+
+    r = SESSION.get(url, headers=headers, timeout=20)
+    if meta and r.status_code == 304:
+        return None, meta
+    r.raise_for_status()
+
+    validators = {
+        "etag": r.headers.get("ETag") or "",
+        "last_modified": r.headers.get("Last-Modified") or "",
     }
+    return r.text, validators
 
-    r = requests.get(url, headers=headers, timeout=20)
-    r.raise_for_status()
-    return r.text
 
+def remember_parsed(url: str, validators: Dict[str, str], parsed: Any) -> None:
+    PARSED_BY_URL[url] = parsed
+    if validators.get("etag") or validators.get("last_modified"):
+        HTTP_META[url] = validators
+    else:
+        HTTP_META.pop(url, None)
 
-def safe_json_loads(s: str) -> Optional[Any]:
+
+def safe_json_loads(s: Union[str, bytes]) -> Optional[Any]:
     try:
-        return json.loads(s)
+        return orjson.loads(s)
     except Exception:
         return None
 
@@ -760,7 +861,7 @@ def get_event_urls_from_sitemap(sitemap_url: str) -> List[str]:
     urls: List[str] = []
 
     try:
-        r = requests.get(sitemap_url, headers={"User-Agent": USER_AGENT}, timeout=10)
+        r = SESSION.get(sitemap_url, timeout=10)
         r.raise_for_status()
         root = ET.fromstring(r.text)
 
@@ -782,12 +883,64 @@ def is_event_node(n: Dict[str, Any]) -> bool:
     return str(t).lower() == "event"
 
 
+MONTHS = "January|February|March|April|May|June|July|August|September|October|November|December"
+
+# Cheap gate in front of dateutil: free-form text without a month name,
+# a d/m-style pair or a year almost never parses, so don't tokenize it.
+DATE_HINT_RE = re.compile(
+    r"(?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)[a-z]*\.?\s+\d{1,2}"
+    r"|\d{1,2}[/-]\d{1,2}"
+    r"|\b(?:19|20)\d{2}"
+    r"|\d{8}",
+    re.IGNORECASE,
+)
+
+MONTH_DATE_RE = re.compile(
+    rf"({MONTHS})\s+\d{{1,2}}(?:st|nd|rd|th)?(?:,\s*\d{{4}})?(?:,\s*\d{{1,2}}(?::\d{{2}})?\s*[ap]\.?\s*m\.?)?",
+    re.IGNORECASE,
+)
+TITLE_DATE_SUFFIX_RE = re.compile(rf":\s*({MONTHS}).*", re.IGNORECASE)
+YEAR_RE = re.compile(r"\d{4}")
+
+
+def fast_parse_iso(s: str) -> datetime:
+    # Almost every startDate is ISO-8601; only fall back to dateutil's
+    # heuristic tokenizer for free-form text that looks like a date.
+    try:
+        return datetime.fromisoformat(s.replace("Z", "+00:00"))
+    except ValueError:
+        if not DATE_HINT_RE.search(s):
+            raise
+        return dtparser.parse(s)
+
+
+@lru_cache(maxsize=4096)
+def parse_iso_utc(value: str) -> Optional[datetime]:
+    # Strict ISO parse for stored start_dt/end_dt values (naive means UTC).
+    # The same strings are re-filtered on every chat request, so memoize.
+    if not isinstance(value, str) or not value:
+        return None
+
+    try:
+        parsed = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    except ValueError:
+        try:
+            parsed = dtparser.isoparse(value)
+        except Exception:
+            return None
+
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+
+    return parsed
+
+
 def parse_datetime_smart(dt_str: str) -> Optional[datetime]:
     if not dt_str:
         return None
 
     try:
-        parsed = dtparser.parse(dt_str)
+        parsed = fast_parse_iso(dt_str)
     except Exception:
         return None
 
@@ -797,6 +950,45 @@ def parse_datetime_smart(dt_str: str) -> Optional[datetime]:
     return parsed.astimezone(timezone.utc)
 
 
+def format_when(sd: Optional[datetime], ed: Optional[datetime]) -> Tuple[str, str]:
+    when = "Date coming soon"
+
+    if sd:
+        start_text = sd.astimezone().strftime("%a, %b %d at %I:%M %p").replace(" 0", " ")
+
+        if ed:
+            end_text = ed.astimezone().strftime("%I:%M %p").lstrip("0")
+            when = f"{start_text} - {end_text}"
+        else:
+            when = start_text
+
+    ends = ed.astimezone().strftime("Ends at %-I:%M %p") if ed else ""
+    return when, ends
+
+
+def event_timestamps(e: Dict[str, Any]) -> Tuple[Optional[float], Optional[float]]:
+    # Use what annotate_event stored; raw rows (e.g. from the DB) are parsed
+    # on the spot, which parse_iso_utc's cache keeps cheap.
+    if "_start_ts" in e:
+        return e["_start_ts"], e["_end_ts"]
+
+    sd = parse_iso_utc(e.get("start_dt") or "")
+    ed = parse_iso_utc(e.get("end_dt") or "")
+    return (sd.timestamp() if sd else None), (ed.timestamp() if ed else None)
+
+
+def annotate_event(e: Dict[str, Any]) -> Dict[str, Any]:
+    # Parse and format the dates once as an event enters the cache, so the
+    # refresh filter/sort and format_events don't reparse them.
+    sd = parse_iso_utc(e.get("start_dt") or "")
+    ed = parse_iso_utc(e.get("end_dt") or "")
+
+    e["_start_ts"] = sd.timestamp() if sd else None
+    e["_end_ts"] = ed.timestamp() if ed else None
+    e["_when"], e["_ends"] = format_when(sd, ed)
+    return e
+
+
 def normalize_location(loc: Any) -> str:
     if isinstance(loc, str):
         return loc.strip()
@@ -820,27 +1012,41 @@ def normalize_location(loc: Any) -> str:
     return ""
 
 
+LXML_PARSER = lxml.html.HTMLParser(encoding="utf-8")
+
+# Let libxml2 pick out the event links instead of visiting every anchor.
+EVENT_LINK_XPATH = lxml.etree.XPath(
+    '//a[contains(@href, "/event/") or contains(@href, "/events/")]'
+)
+# Visible link text only; inline <script>/<style> bodies are not part of the title.
+LINK_TEXT_XPATH = lxml.etree.XPath(".//text()[not(ancestor::script or ancestor::style)]")
+
+
 def extract_events_from_html(html: str, source_name: str, source_url: str) -> List[Dict[str, Any]]:
-    soup = BeautifulSoup(html, "html.parser")
+    # Parse bytes: lxml rejects str input that carries an XML encoding declaration
+    try:
+        tree = lxml.html.fromstring(html.encode("utf-8"), parser=LXML_PARSER)
+    except lxml.etree.ParserError:
+        # Empty or comment-only page
+        return []
     events: List[Dict[str, Any]] = []
 
-    for link in soup.find_all("a", href=True):
-        href = link["href"]
-        if "/event/" in href or "/events/" in href:
-            title = link.get_text(strip=True)
+    for link in EVENT_LINK_XPATH(tree):
+        href = link.get("href")
+        title = "".join(t.strip() for t in LINK_TEXT_XPATH(link))
 
-            if not title or len(title) < 5:
-                continue
+        if not title or len(title) < 5:
+            continue
 
-            full_url = href if href.startswith("http") else source_url.rstrip("/") + "/" + href.lstrip("/")
+        full_url = href if href.startswith("http") else source_url.rstrip("/") + "/" + href.lstrip("/")
 
-            events.append({
-                "title": title,
-                "start_dt": None,
-                "location": "",
-                "source": source_name,
-                "url": full_url,
-            })
+        events.append({
+            "title": title,
+            "start_dt": None,
+            "location": "",
+            "source": source_name,
+            "url": full_url,
+        })
 
         if len(events) >= 15:
             break
@@ -853,9 +1059,27 @@ def extract_greater_parkersburg_events(html: str, source_name: str, source_url:
 
 
 def extract_parkersburg_art_center_events(html: str, source_name: str, source_url: str) -> List[Dict[str, Any]]:
-    soup = BeautifulSoup(html, "html.parser")
+    soup = BeautifulSoup(html, "lxml")
     events: List[Dict[str, Any]] = []
 
+    # One linear pass over the tree collects the heading/paragraph blocks and
+    # where every link sits, so each event's "next link after its heading"
+    # is a bisect rather than a fresh find()/find_next() over the document.
+    blocks: List[Tuple[int, Tag]] = []
+    anchor_positions: List[int] = []
+    anchor_hrefs: List[str] = []
+
+    for pos, node in enumerate(soup.descendants):
+        if not isinstance(node, Tag):
+            continue
+        if node.name in ("h1", "h2", "h3", "p"):
+            blocks.append((pos, node))
+        elif node.name == "a" and node.get("href") is not None:
+            anchor_positions.append(pos)
+            anchor_hrefs.append(node["href"])
+
+    headings: List[Tuple[int, str]] = []
+
     current_title = None
     current_text: List[str] = []
 
@@ -877,34 +1101,25 @@ def extract_parkersburg_art_center_events(html: str, source_name: str, source_ur
         combined = title_line + " " + body
 
         start_dt = None
-        match = re.search(
-            r"(January|February|March|April|May|June|July|August|September|October|November|December)\s+\d{1,2}(?:st|nd|rd|th)?(?:,\s*\d{4})?(?:,\s*\d{1,2}(?::\d{2})?\s*[ap]\.?\s*m\.?)?",
-            combined,
-            re.IGNORECASE,
-        )
+        match = MONTH_DATE_RE.search(combined)
 
         if match:
             date_text = match.group(0)
-            if not re.search(r"\d{4}", date_text):
+            if not YEAR_RE.search(date_text):
                 date_text = f"{date_text}, {now_utc().year}"
             parsed = parse_datetime_smart(date_text)
             if parsed:
                 start_dt = parsed.isoformat()
 
         event_url = source_url
-        heading = soup.find(lambda tag: tag.name in ["h2", "h3"] and title_line in tag.get_text(" ", strip=True))
-        if heading:
-            next_link = heading.find_next("a", href=True)
-            if next_link and next_link.get("href"):
-                href = next_link["href"]
+        heading_pos = next((pos for pos, text in headings if title_line in text), None)
+        if heading_pos is not None:
+            i = bisect.bisect_right(anchor_positions, heading_pos)
+            if i < len(anchor_positions) and anchor_hrefs[i]:
+                href = anchor_hrefs[i]
                 event_url = href if href.startswith("http") else source_url.rstrip("/") + "/" + href.lstrip("/")
 
-        clean_title = re.sub(
-            r":\s*(January|February|March|April|May|June|July|August|September|October|November|December).*",
-            "",
-            title_line,
-            flags=re.IGNORECASE,
-        ).strip()
+        clean_title = TITLE_DATE_SUFFIX_RE.sub("", title_line).strip()
 
         events.append({
             "title": clean_title,
@@ -919,11 +1134,14 @@ def extract_parkersburg_art_center_events(html: str, source_name: str, source_ur
 
     in_past_events = False
 
-    for tag in soup.find_all(["h1", "h2", "h3", "p"]):
+    for pos, tag in blocks:
         text = tag.get_text(" ", strip=True)
         if not text:
             continue
 
+        if tag.name in ("h2", "h3"):
+            headings.append((pos, text))
+
         if text.strip().upper() == "PAST EVENTS":
             flush_event()
             in_past_events = True
@@ -942,22 +1160,65 @@ def extract_parkersburg_art_center_events(html: str, source_name: str, source_ur
     return events
 
 
+JSONLD_RE = re.compile(
+    rb'<script[^>]*type=["\']?application/ld\+json["\']?[^>]*>(.*?)</script>',
+    re.IGNORECASE | re.DOTALL,
+)
+
+
+# Above this size a JSON-LD blob is streamed instead of loaded whole, so a
+# year-long @graph never has to be materialized just to pick out Events.
+JSONLD_STREAM_THRESHOLD = 256 * 1024
+
+
+def iter_jsonld_nodes(raw: Union[str, bytes]) -> Iterator[Dict[str, Any]]:
+    if isinstance(raw, str):
+        raw = raw.encode("utf-8")
+
+    if len(raw) > JSONLD_STREAM_THRESHOLD:
+        prefix = "item" if raw[:1] == b"[" else "@graph.item"
+        streamed = False
+        try:
+            # use_float keeps numbers as floats, matching the orjson path
+            for item in ijson.items(io.BytesIO(raw), prefix, use_float=True):
+                streamed = True
+                yield from flatten_jsonld(item)
+        except Exception as e:
+            if streamed:
+                # Nodes already yielded; reparsing would repeat them.
+                print(f"JSON-LD stream failed after partial read: {e}")
+                return
+            print(f"JSON-LD stream failed, parsing whole blob: {e}")
+
+        if streamed:
+            return
+
+    data = safe_json_loads(raw)
+    if data is not None:
+        yield from flatten_jsonld(data)
+
+
 def extract_events_from_jsonld(html: str, source_name: str, source_url: str) -> List[Dict[str, Any]]:
-    soup = BeautifulSoup(html, "html.parser")
-    scripts = soup.find_all("script", attrs={"type": "application/ld+json"})
+    # Fast path: slice the script bodies straight out of the markup (quoted
+    # or unquoted type); only build a DOM when the regex finds nothing.
+    body = html.encode("utf-8")
+    scripts: List[Union[str, bytes]] = [m.group(1) for m in JSONLD_RE.finditer(body)]
+    if not scripts:
+        try:
+            tree = lxml.html.fromstring(body, parser=LXML_PARSER)
+        except lxml.etree.ParserError:
+            # Empty or comment-only page
+            return []
+        scripts = tree.xpath('//script[@type="application/ld+json"]/text()')
+
     events: List[Dict[str, Any]] = []
 
-    for s in scripts:
-        raw = (s.string or "").strip()
+    for raw in scripts:
+        raw = (raw or "").strip()
         if not raw:
             continue
 
-        data = safe_json_loads(raw)
-        if data is None:
-            continue
-
-        nodes = flatten_jsonld(data)
-        for node in nodes:
+        for node in iter_jsonld_nodes(raw):
             if not is_event_node(node):
                 continue
 
@@ -985,8 +1246,11 @@ def get_adelphia_event_details(event_url: str) -> Dict[str, Any]:
     fallback_title = event_url.split("/")[-2].replace("-", " ").title()
 
     try:
-        html = fetch_html(event_url)
-        soup = BeautifulSoup(html, "html.parser")
+        html, validators = fetch_html(event_url, conditional=event_url in PARSED_BY_URL)
+        if html is None:
+            return PARSED_BY_URL[event_url]
+
+        soup = BeautifulSoup(html, "lxml")
 
         title = fallback_title
         h1 = soup.find("h1")
@@ -1016,13 +1280,15 @@ def get_adelphia_event_details(event_url: str) -> Dict[str, Any]:
                 if parsed:
                     start_dt = parsed.isoformat()
 
-        return {
+        details = {
             "title": title,
             "start_dt": start_dt,
             "location": "The Adelphia",
             "source": "The Adelphia",
             "url": event_url,
         }
+        remember_parsed(event_url, validators, details)
+        return details
 
     except Exception as e:
         print(f"Adelphia detail parse failed: {event_url} -> {e}")
@@ -1035,43 +1301,73 @@ def get_adelphia_event_details(event_url: str) -> Dict[str, Any]:
         }
 
 
+def scrape_source(src: Dict[str, str]) -> List[Dict[str, Any]]:
+    try:
+        html, validators = fetch_html(src["url"], conditional=src["url"] in PARSED_BY_URL)
+        if html is None:
+            return PARSED_BY_URL[src["url"]]
+
+        if src["name"] == "Greater Parkersburg":
+            extracted = extract_greater_parkersburg_events(html, src["name"], src["url"])
+        elif src["name"] == "Parkersburg Art Center":
+            extracted = extract_parkersburg_art_center_events(html, src["name"], src["url"])
+        else:
+            extracted = extract_events_from_jsonld(html, src["name"], src["url"])
+            if not extracted:
+                extracted = extract_events_from_html(html, src["name"], src["url"])
+
+        remember_parsed(src["url"], validators, extracted)
+        return extracted
+
+    except Exception as e:
+        print(f"Source failed: {src['name']} -> {e}")
+        return []
+
+
 def refresh_cache_if_needed(force: bool = False) -> None:
-    ts = _cache.get("ts", 0) or 0
-    if not force and (time.time() - ts) < CACHE_TTL_SECONDS and _cache.get("events"):
+    snap = CURRENT
+    if not force and (time.time() - snap.ts) < CACHE_TTL_SECONDS and snap.events:
         return
 
-    all_events: List[Dict[str, Any]] = []
+    rebuild_cache()
 
-    event_urls = get_event_urls_from_sitemap("https://www.theadelphia.com/adelphia_event-sitemap.xml")
-    for url in event_urls[:10]:
-        all_events.append(get_adelphia_event_details(url))
 
-    all_events.extend(MANUAL_EVENTS)
-    all_events.extend(APPROVED_EVENTS)
+def rebuild_cache() -> None:
+    global CURRENT
 
-    for src in SOURCES:
-        try:
-            html = fetch_html(src["url"])
+    all_events: List[Dict[str, Any]] = []
 
-            if src["name"] == "Greater Parkersburg":
-                extracted = extract_greater_parkersburg_events(html, src["name"], src["url"])
-            elif src["name"] == "Parkersburg Art Center":
-                extracted = extract_parkersburg_art_center_events(html, src["name"], src["url"])
-            else:
-                extracted = extract_events_from_jsonld(html, src["name"], src["url"])
-                if not extracted:
-                    extracted = extract_events_from_html(html, src["name"], src["url"])
+    # Kick off the sources first so they download while the sitemap and
+    # Adelphia detail pages are being fetched.
+    source_futures = [EXECUTOR.submit(scrape_source, src) for src in SOURCES]
 
-            all_events.extend(extracted)
+    event_urls = get_event_urls_from_sitemap("https://www.theadelphia.com/adelphia_event-sitemap.xml")
+    all_events.extend(EXECUTOR.map(get_adelphia_event_details, event_urls[:10]))
 
-        except Exception as e:
-            print(f"Source failed: {src['name']} -> {e}")
+    all_events.extend(MANUAL_EVENTS)
+    with EVENTS_LOCK:
+        all_events.extend(APPROVED_EVENTS)
+
+    for future in source_futures:
+        all_events.extend(future.result())
+
+    # A source can list the same event more than once (repeated links on a
+    # page); keep the first. The key includes the source, so nothing is
+    # merged across sources or with manual/approved entries.
+    # Annotate copies so MANUAL/APPROVED_EVENTS and PARSED_BY_URL stay clean.
+    seen: set = set()
+    unique_events: List[Dict[str, Any]] = []
+    for e in all_events:
+        k = (e.get("source"), e.get("title"), e.get("start_dt"), e.get("url"))
+        if k in seen:
             continue
+        seen.add(k)
+        unique_events.append(annotate_event(dict(e)))
 
-    n = now_utc()
+    n = now_utc().timestamp()
     filtered: List[Dict[str, Any]] = []
 
-    for e in all_events:
+    for e in unique_events:
         start_dt = e.get("start_dt")
         end_dt = e.get("end_dt")
 
@@ -1079,44 +1375,104 @@ def refresh_cache_if_needed(force: bool = False) -> None:
             filtered.append(e)
             continue
 
-        try:
-            sd = dtparser.isoparse(start_dt) if start_dt else None
-            ed = dtparser.isoparse(end_dt) if end_dt else None
+        sd = e["_start_ts"]
+        ed = e["_end_ts"]
 
-            if sd and sd.tzinfo is None:
-                sd = sd.replace(tzinfo=timezone.utc)
-            if ed and ed.tzinfo is None:
-                ed = ed.replace(tzinfo=timezone.utc)
-
-            # Keep future events
-            if sd and sd >= n:
-                filtered.append(e)
-                continue
+        # Keep anything with a date we can't read rather than drop it
+        if (start_dt and sd is None) or (end_dt and ed is None):
+            filtered.append(e)
+            continue
 
-            # Keep events happening right now
-            if sd and ed and sd <= n <= ed:
-                filtered.append(e)
-                continue
+        # Keep future events
+        if sd is not None and sd >= n:
+            filtered.append(e)
+            continue
 
-            # Keep items that only have an end time and haven't ended yet
-            if not sd and ed and ed >= n:
-                filtered.append(e)
-                continue
+        # Keep events happening right now
+        if sd is not None and ed is not None and sd <= n <= ed:
+            filtered.append(e)
+            continue
 
-        except Exception:
+        # Keep items that only have an end time and haven't ended yet
+        if sd is None and ed is not None and ed >= n:
             filtered.append(e)
+            continue
 
 
     def sort_key(e: Dict[str, Any]):
-        start_dt = e.get("start_dt")
-        if not start_dt:
-            return ("1", "9999-12-31T23:59:59+00:00")
-        return ("0", start_dt)
+        if e["_start_ts"] is None:
+            return (1, 0.0)
+        return (0, e["_start_ts"])
 
     filtered.sort(key=sort_key)
 
-    _cache["ts"] = time.time()
-    _cache["events"] = filtered
+    with _cache_lock:
+        CURRENT = Snapshot(ts=time.time(), events=filtered)
+    save_cache_snapshot(CURRENT)
+
+
+def save_cache_snapshot(snap: Snapshot) -> None:
+    try:
+        atomic_write(CACHE_PATH, msgpack.packb({"ts": snap.ts, "events": snap.events}, default=str))
+    except Exception as e:
+        print(f"Failed saving {CACHE_PATH}: {e}")
+
+
+def load_cache_snapshot() -> None:
+    # Restarts and redeploys start from the last scrape if it is still
+    # within the TTL, so the refresher's first pass has nothing to do.
+    global CURRENT
+
+    if not os.path.exists(CACHE_PATH):
+        return
+
+    try:
+        if time.time() - os.path.getmtime(CACHE_PATH) >= CACHE_TTL_SECONDS:
+            return
+
+        with open(CACHE_PATH, "rb") as f:
+            data = msgpack.unpackb(f.read())
+
+        CURRENT = Snapshot(ts=float(data["ts"]), events=list(data["events"]))
+    except Exception as e:
+        print(f"Failed loading {CACHE_PATH}: {e}")
+
+
+def _refresher() -> None:
+    # The only thread that scrapes: requests never refresh the snapshot
+    # themselves (/health reports it; chat and /events read Postgres). The
+    # first pass fills it at boot; after that it wakes on the TTL or when
+    # invalidate_cache() is called after an approval changes APPROVED_EVENTS.
+    force = False
+    first = True
+    while True:
+        try:
+            refresh_cache_if_needed(force=force)
+        except Exception as e:
+            print("Background refresh failed:", e)
+
+        # A snapshot restored at boot was scraped before the restart, so the
+        # first wait only covers what is left of its TTL.
+        timeout = CACHE_TTL_SECONDS
+        if first and CURRENT.ts:
+            timeout = max(0, CACHE_TTL_SECONDS - (time.time() - CURRENT.ts))
+        first = False
+
+        force = _refresh_requested.wait(timeout)
+        _refresh_requested.clear()
+
+
+_refresher_thread: Optional[threading.Thread] = None
+
+
+def start_background_refresh() -> None:
+    global _refresher_thread
+
+    if _refresher_thread and _refresher_thread.is_alive():
+        return
+
+    _refresher_thread = threading.Thread(target=_refresher, name="cache-refresher", daemon=True)
+    _refresher_thread.start()
 
 
 def format_events(events: List[Dict[str, Any]], limit: int = 6) -> str:
@@ -1129,51 +1485,12 @@ def format_events(events: List[Dict[str, Any]], limit: int = 6) -> str:
         title = str(e.get("title", "Event")).strip()
         location = str(e.get("location", "")).strip()
         description = str(e.get("description", "")).strip()
-        start_dt = e.get("start_dt")
-        end_dt = e.get("end_dt")
+        if "_when" not in e:
+            e = annotate_event(dict(e))
 
-        when = "Date coming soon"
-
-        if start_dt:
-            try:
-                sd = dtparser.isoparse(start_dt)
-                if sd.tzinfo is None:
-                    sd = sd.replace(tzinfo=timezone.utc)
-                sd = sd.astimezone()
-
-                start_text = sd.strftime("%a, %b %d at %I:%M %p").replace(" 0", " ")
-
-                if end_dt:
-                    try:
-                        ed = dtparser.isoparse(end_dt)
-                        if ed.tzinfo is None:
-                            ed = ed.replace(tzinfo=timezone.utc)
-                        ed = ed.astimezone()
-                        end_text = ed.strftime("%I:%M %p").lstrip("0")
-                        when = f"{start_text} - {end_text}"
-                    except Exception:
-                        when = start_text
-                else:
-                    when = start_text
-            except Exception:
-                when = "Date coming soon"
-
-        parts = [title, when]
-        if end_dt:
-            try:
-                ed = dtparser.isoparse(end_dt)
-        
-                if ed.tzinfo is None:
-                    ed = ed.replace(tzinfo=timezone.utc)
-        
-                ed = ed.astimezone()
-        
-                ends_text = ed.strftime("Ends at %-I:%M %p")
-        
-                parts.append(ends_text)
-        
-            except Exception:
-                pass
+        parts = [title, e["_when"]]
+        if e["_ends"]:
+            parts.append(e["_ends"])
 
 
         if description:
@@ -1187,30 +1504,55 @@ def format_events(events: List[Dict[str, Any]], limit: int = 6) -> str:
     return "\n\n".join(lines)
 
 
-def classify_query(msg: str) -> str:
-    m = msg.lower()
+def compile_keywords(keywords: List[str]) -> "re.Pattern[str]":
+    # One alternation scanned in C replaces a Python-level any(k in text ...)
+    # loop; still plain substring matching, same as before.
+    return re.compile("|".join(re.escape(k) for k in keywords))
 
-    if any(k in m for k in ["music", "live music", "band", "concert", "show"]):
-        return "music"
 
-    if any(k in m for k in ["art", "exhibit", "gallery"]):
-        return "art"
+# Checked in order; the first intent with a hit wins.
+QUERY_INTENT_RES = [
+    ("music", compile_keywords(["music", "live music", "band", "concert", "show"])),
+    ("art", compile_keywords(["art", "exhibit", "gallery"])),
+    ("classes", compile_keywords(["class", "classes", "workshop", "camp"])),
+    ("family", compile_keywords(["family", "kids", "kid", "children", "child"])),
+    ("weekend", compile_keywords(["weekend", "this weekend", "friday", "saturday"])),
+    ("today", compile_keywords(["today", "tonight"])),
+]
 
-    if any(k in m for k in ["class", "classes", "workshop", "camp"]):
-        return "classes"
+INTENT_KEYWORD_RES = {
+    "music": compile_keywords(["music", "concert", "band", "live", "show"]),
+    "art": compile_keywords(["art", "exhibit", "gallery"]),
+    "classes": compile_keywords(["class", "workshop", "camp", "lesson"]),
+    "family": compile_keywords(["family", "kids", "kid", "children", "child"]),
+}
 
-    if any(k in m for k in ["family", "kids", "kid", "children", "child"]):
-        return "family"
 
-    if any(k in m for k in ["weekend", "this weekend", "friday", "saturday"]):
-        return "weekend"
+def classify_query(msg: str) -> str:
+    m = msg.lower()
 
-    if any(k in m for k in ["today", "tonight"]):
-        return "today"
+    for intent, pattern in QUERY_INTENT_RES:
+        if pattern.search(m):
+            return intent
 
     return "general"
 
 
+def select_local_days(events: List[Dict[str, Any]], first_day: date, days: int) -> List[Dict[str, Any]]:
+    # Turn the local calendar window into two epoch bounds once, then each
+    # event is a float comparison instead of a per-event timezone conversion.
+    lo = datetime.combine(first_day, dtime.min).timestamp()
+    hi = datetime.combine(first_day + timedelta(days=days), dtime.min).timestamp()
+
+    out = []
+    for e in events:
+        sd = event_timestamps(e)[0]
+        if sd is not None and lo <= sd < hi:
+            out.append(e)
+
+    return out
+
+
 def filter_by_intent(events: List[Dict[str, Any]], intent: str) -> List[Dict[str, Any]]:
     if intent == "general":
         return events
@@ -1218,24 +1560,9 @@ def filter_by_intent(events: List[Dict[str, Any]], intent: str) -> List[Dict[str
     now = now_utc()
 
     if intent == "today":
-        out = []
-        for e in events:
-            start_dt = e.get("start_dt")
-            if not start_dt:
-                continue
-            try:
-                sd = dtparser.isoparse(start_dt)
-                if sd.tzinfo is None:
-                    sd = sd.replace(tzinfo=timezone.utc)
-                sd = sd.astimezone()
-                if sd.date() == now.astimezone().date():
-                    out.append(e)
-            except Exception:
-                continue
-        return out
+        return select_local_days(events, now.astimezone().date(), 1)
 
     if intent == "weekend":
-        out = []
         local_now = now.astimezone()
         weekday = local_now.weekday()  # Monday=0 ... Sunday=6
 
@@ -1246,26 +1573,8 @@ def filter_by_intent(events: List[Dict[str, Any]], intent: str) -> List[Dict[str
             # Monday-Thursday -> use UPCOMING weekend
             friday = (local_now + timedelta(days=4 - weekday)).date()
 
-        sunday = friday + timedelta(days=2)
-
-        for e in events:
-            start_dt = e.get("start_dt")
-            if not start_dt:
-                continue
-
-            try:
-                sd = dtparser.isoparse(start_dt)
-                if sd.tzinfo is None:
-                    sd = sd.replace(tzinfo=timezone.utc)
-
-                sd = sd.astimezone()
-
-                if friday <= sd.date() <= sunday:
-                    out.append(e)
-            except Exception:
-                continue
-
-        return out
+        # Friday through Sunday inclusive
+        return select_local_days(events, friday, 3)
 
     if intent == "right_now":
         active = get_right_now_events(events)
@@ -1276,15 +1585,8 @@ def filter_by_intent(events: List[Dict[str, Any]], intent: str) -> List[Dict[str
         return []
 
 
-    keywords = {
-        "music": ["music", "concert", "band", "live", "show"],
-        "art": ["art", "exhibit", "gallery"],
-        "classes": ["class", "workshop", "camp", "lesson"],
-        "family": ["family", "kids", "kid", "children", "child"],
-    }
-
-    ks = keywords.get(intent, [])
-    if not ks:
+    pattern = INTENT_KEYWORD_RES.get(intent)
+    if not pattern:
         return events
 
     out = []
@@ -1299,7 +1601,7 @@ def filter_by_intent(events: List[Dict[str, Any]], intent: str) -> List[Dict[str
         ]).lower()
 
 
-        if any(k in hay for k in ks):
+        if pattern.search(hay):
             out.append(e)
 
     return out
@@ -1312,10 +1614,10 @@ def home():
 
 @app.get("/health")
 def health():
-    refresh_cache_if_needed(force=True)
+    snap = CURRENT
     return jsonify({
         "ok": True,
-        "events_cached": len(_cache.get("events", [])),
+        "events_cached": len(snap.events),
         "build": "stable-reset-v2-approve",
     })
 
@@ -1336,36 +1638,21 @@ def events():
     events = get_all_events()
 
     return app.response_class(
-        response=json.dumps(events, indent=2),
+        response=orjson.dumps(events, option=orjson.OPT_INDENT_2),
         status=200,
         mimetype="application/json",
     )
 
 
 def get_right_now_events(events: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
-    now = now_utc()
+    now = now_utc().timestamp()
     active = []
 
     for e in events:
-        start_dt = e.get("start_dt")
-        end_dt = e.get("end_dt")
-
-        if not start_dt or not end_dt:
-            continue
+        sd, ed = event_timestamps(e)
 
-        try:
-            sd = dtparser.isoparse(start_dt)
-            ed = dtparser.isoparse(end_dt)
-
-            if sd.tzinfo is None:
-                sd = sd.replace(tzinfo=timezone.utc)
-            if ed.tzinfo is None:
-                ed = ed.replace(tzinfo=timezone.utc)
-
-            if sd <= now <= ed:
-                active.append(e)
-        except Exception:
-            continue
+        if sd is not None and ed is not None and sd <= now <= ed:
+            active.append(e)
 
     return active
 
@@ -1397,8 +1684,7 @@ def handle_chat():
 
     
     try:
-        events = get_all_events()
-        events = filter_future_events(events)
+        events = filter_future_events(get_all_events())
         print("CHAT EVENTS COUNT:", len(events))
     except Exception as e:
         print("Events load error:", e)
@@ -1541,13 +1827,16 @@ def handle_chat():
 
     # 🔥 AI LAYER (SAFE WRAPPED)
     try:
-        ai_reply = generate_ai_response(msg, scoped, CONVERSATION_HISTORY)
-        
-        CONVERSATION_HISTORY.append({"role": "user", "content": msg})
-        CONVERSATION_HISTORY.append({"role": "assistant", "content": ai_reply})
+        with CONVERSATION_LOCK:
+            history = list(CONVERSATION_HISTORY)
+        ai_reply = generate_ai_response(msg, scoped, history)
         
-        if len(CONVERSATION_HISTORY) > 10:
-            del CONVERSATION_HISTORY[:-10]
+        with CONVERSATION_LOCK:
+            CONVERSATION_HISTORY.append({"role": "user", "content": msg})
+            CONVERSATION_HISTORY.append({"role": "assistant", "content": ai_reply})
+
+            if len(CONVERSATION_HISTORY) > 10:
+                del CONVERSATION_HISTORY[:-10]
     
         if ai_reply:
             return jsonify({"message": ai_reply}), 200
@@ -1594,6 +1883,20 @@ def handle_chat():
     
     return jsonify({"message": reply}), 200
     
+# Canned replies never change, so serialize them once instead of running
+# jsonify on every request that hits them.
+LUMI_FALLBACK_BODY = orjson.dumps({
+    "message": "Lumi is having a little trouble answering right now. Try again in a moment."
+})
+FSPT_FALLBACK_BODY = orjson.dumps({
+    "message": "The First Settlement Physical Therapy Assistant is having a little trouble answering right now. Try again in a moment."
+})
+
+
+def static_json(body: bytes, status: int = 200) -> Response:
+    return Response(body, status=status, mimetype="application/json")
+
+
 @app.post("/lumi-chat")
 def handle_lumi_chat():
     data = request.get_json(silent=True) or {}
@@ -1604,9 +1907,7 @@ def handle_lumi_chat():
     if ai_reply:
         return jsonify({"message": ai_reply}), 200
 
-    return jsonify({
-        "message": "Lumi is having a little trouble answering right now. Try again in a moment."
-    }), 200
+    return static_json(LUMI_FALLBACK_BODY)
 
     
 @app.post("/fspt-chat")
@@ -1619,9 +1920,7 @@ def handle_fspt_chat():
     if ai_reply:
         return jsonify({"message": ai_reply}), 200
 
-    return jsonify({
-        "message": "The First Settlement Physical Therapy Assistant is having a little trouble answering right now. Try again in a moment."
-    }), 200
+    return static_json(FSPT_FALLBACK_BODY)
 
 @app.get("/bulk-ingest")
 def bulk_ingest():
@@ -1640,7 +1939,7 @@ def bulk_ingest():
     </body>
     </html>
     """
-    return render_template_string(html)
+    return html
 
 @app.post("/bulk-ingest")
 def bulk_ingest_post():
@@ -1760,10 +2059,12 @@ def bulk_ingest_save():
             "description": descriptions[i]
         }
 
-        PENDING_EVENTS.append(event)
+        with EVENTS_LOCK:
+            PENDING_EVENTS.append(event)
         count += 1
 
-    save_events_to_file(PENDING_EVENTS_FILE, PENDING_EVENTS)
+    with EVENTS_LOCK:
+        save_events_to_file(PENDING_EVENTS_FILE, PENDING_EVENTS)
 
     return f"""
     <html>
@@ -1781,7 +2082,7 @@ def bulk_ingest_save():
 @app.get("/pending-events")
 def pending_events():
     return app.response_class(
-        response=json.dumps(PENDING_EVENTS, indent=2),
+        response=orjson.dumps(PENDING_EVENTS, option=orjson.OPT_INDENT_2),
         status=200,
         mimetype="application/json",
     )
@@ -1796,8 +2097,8 @@ def test_add_brewery_deal():
         "url": "",
     }
 
-    PENDING_EVENTS.append(event)
-    _cache["ts"] = 0
+    with EVENTS_LOCK:
+        PENDING_EVENTS.append(event)
 
     return {"ok": True, "message": "Brewery deal added to pending"}
 
@@ -1848,17 +2149,19 @@ def save_event_to_db(event):
 
 @app.get("/approve-latest")
 def approve_latest():
-    if not PENDING_EVENTS:
-        return {"ok": False, "message": "No pending events to approve"}, 404
+    with EVENTS_LOCK:
+        if not PENDING_EVENTS:
+            return {"ok": False, "message": "No pending events to approve"}, 404
+
+        event = PENDING_EVENTS.pop()
+        APPROVED_EVENTS.append(event)
 
-    event = PENDING_EVENTS.pop()
     print("APPROVING EVENT:", event)
     
-    APPROVED_EVENTS.append(event)
-    
     print("ABOUT TO SAVE TO DB")
     save_event_to_db(event)
     print("FINISHED SAVE TO DB")
+    invalidate_cache()
 
 
 
@@ -1954,7 +2257,7 @@ def dashboard():
     </body>
     </html>
     """
-    return render_template_string(html)
+    return html
 
 @app.get("/add-event")
 def add_event_form():
@@ -2058,7 +2361,7 @@ def add_event_form():
     </body>
     </html>
     """
-    return render_template_string(html)
+    return html
 
 
 @app.post("/submit-event-form")
@@ -2086,9 +2389,9 @@ def submit_event_form():
         "description": description,
     }
 
-    PENDING_EVENTS.append(event)
-    save_events_to_file(PENDING_EVENTS_FILE, PENDING_EVENTS)
-    _cache["ts"] = 0
+    with EVENTS_LOCK:
+        PENDING_EVENTS.append(event)
+        save_events_to_file(PENDING_EVENTS_FILE, PENDING_EVENTS)
 
     return f"""
     <html>
@@ -2192,19 +2495,24 @@ def review_pending():
     </body>
     </html>
     """
-    return render_template_string(html, events=PENDING_EVENTS)
+    with EVENTS_LOCK:
+        pending = list(PENDING_EVENTS)
+
+    return render_template_string(html, events=pending)
 
 
 @app.post("/approve-pending/<int:event_index>")
 def approve_pending(event_index: int):
-    if event_index < 0 or event_index >= len(PENDING_EVENTS):
-        return "Pending event not found", 404
+    with EVENTS_LOCK:
+        if event_index < 0 or event_index >= len(PENDING_EVENTS):
+            return "Pending event not found", 404
+
+        event = PENDING_EVENTS.pop(event_index)
+        APPROVED_EVENTS.append(event)
 
-    event = PENDING_EVENTS.pop(event_index)
-    APPROVED_EVENTS.append(event)
     save_event_to_db(event)
 
-    _cache["ts"] = 0
+    invalidate_cache()
 
     return """
     <html>
@@ -2219,12 +2527,12 @@ def approve_pending(event_index: int):
 
 @app.post("/reject-pending/<int:event_index>")
 def reject_pending(event_index: int):
-    if event_index < 0 or event_index >= len(PENDING_EVENTS):
-        return "Pending event not found", 404
+    with EVENTS_LOCK:
+        if event_index < 0 or event_index >= len(PENDING_EVENTS):
+            return "Pending event not found", 404
 
-    PENDING_EVENTS.pop(event_index)
-    save_events_to_file(PENDING_EVENTS_FILE, PENDING_EVENTS)
-    _cache["ts"] = 0
+        PENDING_EVENTS.pop(event_index)
+        save_events_to_file(PENDING_EVENTS_FILE, PENDING_EVENTS)
 
 
     return """
@@ -2238,7 +2546,7 @@ def reject_pending(event_index: int):
 @app.get("/approved-events")
 def approved_events():
     return app.response_class(
-        response=json.dumps(APPROVED_EVENTS, indent=2),
+        response=orjson.dumps(APPROVED_EVENTS, option=orjson.OPT_INDENT_2),
         status=200,
         mimetype="application/json",
     )
@@ -2270,8 +2578,8 @@ def submit_event():
         "description": description,
     }
 
-    PENDING_EVENTS.append(event)
-    _cache["ts"] = 0
+    with EVENTS_LOCK:
+        PENDING_EVENTS.append(event)
 
     return jsonify({"ok": True, "event": event}), 200  
 
@@ -2282,7 +2590,10 @@ def chat():
 @app.post("/el-chat/chat")
 def el_chat_chat():
     return handle_chat()
-    
+
+
+load_cache_snapshot()
+start_background_refresh()
 
 if __name__ == "__main__":
     port = int(os.environ.get("PORT", "10000"))
@@ -0,0 +1,14 @@
+import os
+
+bind = f"0.0.0.0:{os.environ.get('PORT', '10000')}"
+
+# Pending/approved events and chat context live in module globals, so
+# extra processes would each see their own copy. Scale with threads (app.py
+# guards that state with EVENTS_LOCK/CONVERSATION_LOCK); only raise
+# WEB_CONCURRENCY once it is moved out of process.
+workers = int(os.environ.get("WEB_CONCURRENCY", "1"))
+worker_class = "gthread"
+threads = int(os.environ.get("GUNICORN_THREADS", "8"))
+
+# Keep-alive lets the chat widget reuse its connection between messages.
+keepalive = 5